@@ -44,6 +44,14 @@ def ome_zarr_logger(level: Any) -> Generator[None, None, None]:
         logger.setLevel(current_level)
 
 
+def _get_store_path(group: zarr.Group) -> str:
+    """Get the path of the store of a zarr group, also when the group has been opened with consolidated metadata."""
+    store = group.store
+    if isinstance(store, zarr.storage.ConsolidatedMetadataStore):
+        store = store.store
+    return store.path  # type: ignore[no-any-return]
+
+
 def _get_transformations_from_ngff_dict(
     list_of_encoded_ngff_transformations: list[dict[str, Any]]
 ) -> MappingToCoordinateSystem_t:
@@ -10,6 +10,7 @@ from ome_zarr.format import Format
 
 from spatialdata._io import SpatialDataFormatV01
 from spatialdata._io._utils import (
+    _get_store_path,
     _get_transformations_from_ngff_dict,
     _write_metadata,
     overwrite_coordinate_transformations_non_raster,
@@ -27,19 +28,20 @@ def _read_points(
     fmt: SpatialDataFormatV01 = CurrentPointsFormat(),
 ) -> DaskDataFrame:
     """Read points from a zarr store."""
-    assert isinstance(store, (str, Path))
-    f = zarr.open(store, mode="r")
+    assert isinstance(store, (str, Path, zarr.Group))
+    f = store if isinstance(store, zarr.Group) else zarr.open(store, mode="r")
+    attrs_dict = f.attrs.asdict()
 
-    path = os.path.join(f._store.path, f.path, "points.parquet")
+    path = os.path.join(_get_store_path(f), f.path, "points.parquet")
     # cache on remote file needed for parquet reader to work
     # TODO: allow reading in the metadata without caching all the data
     table = read_parquet("simplecache::" + path if "http" in path else path)
     assert isinstance(table, DaskDataFrame)
 
-    transformations = _get_transformations_from_ngff_dict(f.attrs.asdict()["coordinateTransformations"])
+    transformations = _get_transformations_from_ngff_dict(attrs_dict["coordinateTransformations"])
     _set_transformations(table, transformations)
 
-    attrs = fmt.attrs_from_dict(f.attrs.asdict())
+    attrs = fmt.attrs_from_dict(attrs_dict)
     if len(attrs):
         table.attrs["spatialdata_attrs"] = attrs
     return table
@@ -1,7 +1,7 @@
+import os
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
 
-import numpy as np
 import zarr
 from multiscale_spatial_image import MultiscaleSpatialImage
 from ome_zarr.format import Format
@@ -18,6 +18,7 @@ from xarray import DataArray
 
 from spatialdata._io import SpatialDataFormatV01
 from spatialdata._io._utils import (
+    _get_store_path,
     _get_transformations_from_ngff_dict,
     _iter_multiscale,
     overwrite_coordinate_transformations_raster,
@@ -32,10 +33,15 @@ from spatialdata.transformations._utils import (
 
 
 def _read_multiscale(
-    store: Union[str, Path], raster_type: Literal["image", "labels"], fmt: SpatialDataFormatV01 = CurrentRasterFormat()
+    store: Union[str, Path, zarr.Group],
+    raster_type: Literal["image", "labels"],
+    fmt: SpatialDataFormatV01 = CurrentRasterFormat(),
 ) -> Union[SpatialImage, MultiscaleSpatialImage]:
-    assert isinstance(store, (str, Path))
+    assert isinstance(store, (str, Path, zarr.Group))
     assert raster_type in ["image", "labels"]
+    if isinstance(store, zarr.Group):
+        # ome-zarr-py can only open a location from its path
+        store = os.path.join(_get_store_path(store), store.path)
     nodes: list[Node] = []
     image_loc = ZarrLocation(store)
     if image_loc.exists():
@@ -43,11 +49,9 @@ def _read_multiscale(
         image_nodes = list(image_reader)
         if len(image_nodes):
             for node in image_nodes:
-                if np.any([isinstance(spec, Multiscales) for spec in node.specs]) and (
-                    raster_type == "image"
-                    and np.all([not isinstance(spec, Label) for spec in node.specs])
-                    or raster_type == "labels"
-                    and np.any([isinstance(spec, Label) for spec in node.specs])
+                is_label = any(isinstance(spec, Label) for spec in node.specs)
+                if any(isinstance(spec, Multiscales) for spec in node.specs) and (
+                    raster_type == "image" and not is_label or raster_type == "labels" and is_label
                 ):
                     nodes.append(node)
     if len(nodes) != 1:
@@ -56,9 +60,11 @@ def _read_multiscale(
             f"bug and attach a minimal data example."
         )
     node = nodes[0]
-    datasets = node.load(Multiscales).datasets
-    multiscales = node.load(Multiscales).zarr.root_attrs["multiscales"]
-    channels_metadata = node.load(Multiscales).zarr.root_attrs.get("channels_metadata", None)
+    ms = node.load(Multiscales)
+    datasets = ms.datasets
+    root_attrs = ms.zarr.root_attrs
+    multiscales = root_attrs["multiscales"]
+    channels_metadata = root_attrs.get("channels_metadata", None)
     assert len(multiscales) == 1
     # checking for multiscales[0]["coordinateTransformations"] would make fail
     # something that doesn't have coordinateTransformations in top level
@@ -73,10 +79,13 @@ def _read_multiscale(
     if raster_type == "image" and channels_metadata is not None:
         channels = fmt.channels_from_metadata(channels_metadata)
     axes = [i["name"] for i in node.metadata["axes"]]
+    # the reader already (lazily) opened every scale of the pyramid when building the node, so we reuse those arrays
+    # instead of opening each scale, and reading its metadata, a second time
+    arrays = node.data
+    assert len(arrays) == len(datasets)
     if len(datasets) > 1:
         multiscale_image = {}
-        for i, d in enumerate(datasets):
-            data = node.load(Multiscales).array(resolution=d, version=fmt.version)
+        for i, data in enumerate(arrays):
             multiscale_image[f"scale{i}"] = DataArray(
                 data,
                 name="image",
@@ -86,9 +95,8 @@ def _read_multiscale(
         msi = MultiscaleSpatialImage.from_dict(multiscale_image)
         _set_transformations(msi, transformations)
         return compute_coordinates(msi)
-    data = node.load(Multiscales).array(resolution=datasets[0], version=fmt.version)
     si = SpatialImage(
-        data,
+        arrays[0],
         name="image",
         dims=axes,
         coords={"c": channels} if channels is not None else {},
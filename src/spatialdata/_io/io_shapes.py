@@ -1,7 +1,11 @@
+import os
+import threading
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
+import dask.array as da
 import numpy as np
 import zarr
 from geopandas import GeoDataFrame
@@ -21,29 +25,58 @@ from spatialdata.transformations._utils import (
     _set_transformations,
 )
 
+# maximum number of threads used to read the chunks of the arrays of shapes elements
+MAX_READ_ARRAY_WORKERS = 8
+
+# the shapes elements are themselves read concurrently (see read_zarr()), so all of them share one pool when reading
+# the chunks of their arrays, instead of dask creating a thread pool for every calling thread. The pool is created on
+# first use
+_read_array_pool: Optional[ThreadPoolExecutor] = None
+_read_array_pool_lock = threading.Lock()
+
+
+def _get_read_array_pool() -> ThreadPoolExecutor:
+    global _read_array_pool
+    with _read_array_pool_lock:
+        if _read_array_pool is None:
+            _read_array_pool = ThreadPoolExecutor(max_workers=min(MAX_READ_ARRAY_WORKERS, os.cpu_count() or 1))
+        return _read_array_pool
+
+
+def _read_array(array: zarr.Array) -> np.ndarray:  # type: ignore[type-arg]
+    """Read a zarr array in memory, fetching and decompressing its chunks concurrently when there is more than one."""
+    if array.nchunks > 1:
+        # each chunk is decoded directly into its region of the output, so that no concatenated copy is made
+        out = np.empty(array.shape, dtype=array.dtype)
+        da.store(da.from_zarr(array), out, lock=False, scheduler="threads", pool=_get_read_array_pool())
+        return out
+    return array[:]  # type: ignore[no-any-return]
+
 
 def _read_shapes(
     store: Union[str, Path, MutableMapping, zarr.Group],  # type: ignore[type-arg]
     fmt: SpatialDataFormatV01 = CurrentShapesFormat(),
 ) -> GeoDataFrame:
     """Read shapes from a zarr store."""
-    assert isinstance(store, (str, Path))
-    f = zarr.open(store, mode="r")
+    assert isinstance(store, (str, Path, zarr.Group))
+    f = store if isinstance(store, zarr.Group) else zarr.open(store, mode="r")
+    attrs_dict = f.attrs.asdict()
 
-    coords = np.array(f["coords"])
+    coords = _read_array(f["coords"])
     index = np.array(f["Index"])
-    typ = fmt.attrs_from_dict(f.attrs.asdict())
+    typ = fmt.attrs_from_dict(attrs_dict)
     if typ.name == "POINT":
         radius = np.array(f["radius"])
         geometry = from_ragged_array(typ, coords)
         geo_df = GeoDataFrame({"geometry": geometry, "radius": radius}, index=index)
     else:
         offsets_keys = [k for k in f if k.startswith("offset")]
-        offsets = tuple(np.array(f[k]).flatten() for k in offsets_keys)
+        # the offsets are stored as 1D arrays, so ravel() doesn't copy them (contrary to flatten())
+        offsets = tuple(_read_array(f[k]).ravel() for k in offsets_keys)
         geometry = from_ragged_array(typ, coords, offsets)
         geo_df = GeoDataFrame({"geometry": geometry}, index=index)
 
-    transformations = _get_transformations_from_ngff_dict(f.attrs.asdict()["coordinateTransformations"])
+    transformations = _get_transformations_from_ngff_dict(attrs_dict["coordinateTransformations"])
     _set_transformations(geo_df, transformations)
     return geo_df
 
@@ -1,9 +1,41 @@
+import os
+
+import numpy as np
 import zarr
 from anndata import AnnData
+from anndata import read_zarr as read_anndata_zarr
 from anndata._io.specs import write_elem as write_adata
+from anndata.experimental import read_elem
 from ome_zarr.format import Format
 
+from spatialdata._io._utils import _get_store_path
 from spatialdata._io.format import CurrentTablesFormat
+from spatialdata.models import TableModel
+
+
+def _read_table(f_elem: zarr.Group) -> AnnData:
+    """Read the table from a zarr group."""
+    if isinstance(f_elem.store, zarr.storage.ConsolidatedMetadataStore):
+        table = read_elem(f_elem)
+        # we can replace read_elem with read_anndata_zarr after this PR gets into a release (>= 0.6.5)
+        # https://github.com/scverse/anndata/pull/1057#pullrequestreview-1530623183
+        # table = read_anndata_zarr(f_elem)
+    else:
+        # anndata < 0.9.2 can't read from a zarr.Group, so we pass the path of the group
+        table = read_anndata_zarr(os.path.join(_get_store_path(f_elem), f_elem.path))
+    if TableModel.ATTRS_KEY in table.uns:
+        # fill out eventual missing attributes that has been omitted because their value was None
+        attrs = table.uns[TableModel.ATTRS_KEY]
+        if "region" not in attrs:
+            attrs["region"] = None
+        if "region_key" not in attrs:
+            attrs["region_key"] = None
+        if "instance_key" not in attrs:
+            attrs["instance_key"] = None
+        # fix type for region
+        if "region" in attrs and isinstance(attrs["region"], np.ndarray):
+            attrs["region"] = attrs["region"].tolist()
+    return table
 
 
 def write_table(
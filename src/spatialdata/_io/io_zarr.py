@@ -1,26 +1,27 @@
 import logging
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-import numpy as np
 import zarr
 from anndata import AnnData
-from anndata import read_zarr as read_anndata_zarr
-from anndata.experimental import read_elem
+from zarr.errors import MetadataError
 
 from spatialdata._core.spatialdata import SpatialData
 from spatialdata._io._utils import ome_zarr_logger
 from spatialdata._io.io_points import _read_points
 from spatialdata._io.io_raster import _read_multiscale
 from spatialdata._io.io_shapes import _read_shapes
+from spatialdata._io.io_table import _read_table
 from spatialdata._logging import logger
-from spatialdata.models import TableModel
 
+# maximum number of threads used to concurrently read the elements of a SpatialData object
+MAX_READ_WORKERS = 32
 
-def _open_zarr_store(store: Union[str, Path, zarr.Group]) -> tuple[zarr.Group, str]:
+
+def _open_zarr_store(store: Union[str, Path, zarr.Group]) -> zarr.Group:
     """
-    Open a zarr store (on-disk or remote) and return the zarr.Group object and the path to the store.
+    Open a zarr store (on-disk or remote) and return the zarr.Group object.
 
     Parameters
     ----------
@@ -29,14 +30,40 @@ def _open_zarr_store(store: Union[str, Path, zarr.Group]) -> tuple[zarr.Group, s
 
     Returns
     -------
-    A tuple of the zarr.Group object and the path to the store.
+    The zarr.Group object of the root of the store.
     """
-    f = store if isinstance(store, zarr.Group) else zarr.open(store, mode="r")
+    is_remote = isinstance(store, (str, Path)) and str(store).startswith("http")
+    if isinstance(store, zarr.Group):
+        f = store
+    elif is_remote:
+        # each metadata file of a remote store requires a separate request, so we first try to read the consolidated
+        # metadata (written by SpatialData.write()) in one go. We don't do this for local stores because they may have
+        # been incrementally updated after the metadata was consolidated.
+        try:
+            f = zarr.open_consolidated(store, mode="r")
+        except (KeyError, MetadataError):
+            f = zarr.open(store, mode="r")
+    else:
+        f = zarr.open(store, mode="r")
     # workaround: .zmetadata is being written as zmetadata (https://github.com/zarr-developers/zarr-python/issues/1121)
-    if isinstance(store, (str, Path)) and str(store).startswith("http") and len(f) == 0:
+    if is_remote and len(f) == 0:
         f = zarr.open_consolidated(store, mode="r", metadata_key="zmetadata")
-    f_store_path = f.store.store.path if isinstance(f.store, zarr.storage.ConsolidatedMetadataStore) else f.store.path
-    return f, f_store_path
+    return f
+
+
+def _read_element(element_type: str, f_elem: zarr.Group) -> Any:
+    """Read a single element of a given type from its zarr group."""
+    if element_type == "images":
+        return _read_multiscale(f_elem, raster_type="image")
+    if element_type == "labels":
+        return _read_multiscale(f_elem, raster_type="labels")
+    if element_type == "points":
+        return _read_points(f_elem)
+    if element_type == "shapes":
+        return _read_shapes(f_elem)
+    if element_type == "table":
+        return _read_table(f_elem)
+    raise ValueError(f"Unknown element type: {element_type}.")
 
 
 def read_zarr(store: Union[str, Path, zarr.Group], selection: Optional[tuple[str]] = None) -> SpatialData:
@@ -56,104 +83,42 @@ def read_zarr(store: Union[str, Path, zarr.Group], selection: Optional[tuple[str
     -------
     A SpatialData object.
     """
-    f, f_store_path = _open_zarr_store(store)
-
-    images = {}
-    labels = {}
-    points = {}
-    table: Optional[AnnData] = None
-    shapes = {}
+    f = _open_zarr_store(store)
 
     selector = {"images", "labels", "points", "shapes", "table"} if not selection else set(selection or [])
     logger.debug(f"Reading selection {selector}")
 
-    # read multiscale images
-    if "images" in selector and "images" in f:
-        group = f["images"]
-        count = 0
-        for subgroup_name in group:
-            if Path(subgroup_name).name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem = group[subgroup_name]
-            f_elem_store = os.path.join(f_store_path, f_elem.path)
-            element = _read_multiscale(f_elem_store, raster_type="image")
-            images[subgroup_name] = element
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
-
-    # read multiscale labels
-    with ome_zarr_logger(logging.ERROR):
-        if "labels" in selector and "labels" in f:
-            group = f["labels"]
+    # collect the elements to read, the actual reading is done below
+    elements_to_read: list[tuple[str, str, zarr.Group]] = []
+    for element_type in ["images", "labels", "points", "shapes", "table"]:
+        if element_type in selector and element_type in f:
+            group = f[element_type]
             count = 0
             for subgroup_name in group:
                 if Path(subgroup_name).name.startswith("."):
                     # skip hidden files like .zgroup or .zmetadata
                     continue
-                f_elem = group[subgroup_name]
-                f_elem_store = os.path.join(f_store_path, f_elem.path)
-                labels[subgroup_name] = _read_multiscale(f_elem_store, raster_type="labels")
+                elements_to_read.append((element_type, subgroup_name, group[subgroup_name]))
                 count += 1
             logger.debug(f"Found {count} elements in {group}")
 
-    # now read rest of the data
-    if "points" in selector and "points" in f:
-        group = f["points"]
-        count = 0
-        for subgroup_name in group:
-            f_elem = group[subgroup_name]
-            if Path(subgroup_name).name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem_store = os.path.join(f_store_path, f_elem.path)
-            points[subgroup_name] = _read_points(f_elem_store)
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
-
-    if "shapes" in selector and "shapes" in f:
-        group = f["shapes"]
-        count = 0
-        for subgroup_name in group:
-            if Path(subgroup_name).name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem = group[subgroup_name]
-            f_elem_store = os.path.join(f_store_path, f_elem.path)
-            shapes[subgroup_name] = _read_shapes(f_elem_store)
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
-
-    if "table" in selector and "table" in f:
-        group = f["table"]
-        count = 0
-        for subgroup_name in group:
-            if Path(subgroup_name).name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem = group[subgroup_name]
-            f_elem_store = os.path.join(f_store_path, f_elem.path)
-            if isinstance(f.store, zarr.storage.ConsolidatedMetadataStore):
-                table = read_elem(f_elem)
-                # we can replace read_elem with read_anndata_zarr after this PR gets into a release (>= 0.6.5)
-                # https://github.com/scverse/anndata/pull/1057#pullrequestreview-1530623183
-                # table = read_anndata_zarr(f_elem)
-            else:
-                table = read_anndata_zarr(f_elem_store)
-            if TableModel.ATTRS_KEY in table.uns:
-                # fill out eventual missing attributes that has been omitted because their value was None
-                attrs = table.uns[TableModel.ATTRS_KEY]
-                if "region" not in attrs:
-                    attrs["region"] = None
-                if "region_key" not in attrs:
-                    attrs["region_key"] = None
-                if "instance_key" not in attrs:
-                    attrs["instance_key"] = None
-                # fix type for region
-                if "region" in attrs and isinstance(attrs["region"], np.ndarray):
-                    attrs["region"] = attrs["region"].tolist()
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
+    # reading an element is mostly I/O bound (especially for remote stores), so the elements are read concurrently
+    with ome_zarr_logger(logging.ERROR), ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_READ_WORKERS, len(elements_to_read)))
+    ) as executor:
+        read_elements = list(executor.map(lambda e: _read_element(e[0], e[2]), elements_to_read))
+
+    images: dict[str, Any] = {}
+    labels: dict[str, Any] = {}
+    points: dict[str, Any] = {}
+    table: Optional[AnnData] = None
+    shapes: dict[str, Any] = {}
+    elements: dict[str, dict[str, Any]] = {"images": images, "labels": labels, "points": points, "shapes": shapes}
+    for (element_type, subgroup_name, _), element in zip(elements_to_read, read_elements):
+        if element_type == "table":
+            table = element
+        else:
+            elements[element_type][subgroup_name] = element
 
     sdata = SpatialData(
         images=images,
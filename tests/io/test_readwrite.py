@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
+import zarr
 from anndata import AnnData
 from dask.dataframe.core import DataFrame as DaskDataFrame
 from dask.dataframe.utils import assert_eq
@@ -14,12 +15,14 @@ from shapely.geometry import Point
 from spatial_image import SpatialImage
 from spatialdata import SpatialData, read_zarr
 from spatialdata._io._utils import _are_directories_identical
+from spatialdata._io.io_zarr import _open_zarr_store
 from spatialdata.models import TableModel
 from spatialdata.transformations.operations import (
     get_transformation,
     set_transformation,
 )
 from spatialdata.transformations.transformations import Identity, Scale
+from zarr.errors import MetadataError
 
 from tests.conftest import _get_images, _get_labels, _get_points, _get_shapes
 
@@ -58,6 +61,24 @@ class TestReadWrite:
                 assert shapes.shapes["circles"]["radius"].equals(sdata.shapes["circles"]["radius"])
                 assert isinstance(sdata.shapes["circles"]["geometry"][0], Point)
 
+    def test_shapes_multiple_chunks(self, tmp_path: str, shapes: SpatialData) -> None:
+        """Test reading shapes whose coordinates and offsets are stored in multiple chunks."""
+        tmpdir = Path(tmp_path) / "tmp.zarr"
+        shapes.write(tmpdir)
+        # rewrite the coordinates and the offsets with small chunks, so that they are read chunk by chunk
+        root = zarr.open(tmpdir, mode="r+")
+        for name in shapes.shapes:
+            group = root["shapes"][name]
+            for key in [k for k in group if k == "coords" or k.startswith("offset")]:
+                data = group[key][:]
+                del group[key]
+                group.create_dataset(name=key, data=data, chunks=(2,) + data.shape[1:])
+                assert group[key].nchunks > 1
+        sdata = SpatialData.read(tmpdir)
+        assert shapes.shapes.keys() == sdata.shapes.keys()
+        for k in shapes.shapes:
+            assert shapes.shapes[k].equals(sdata.shapes[k])
+
     def test_points(self, tmp_path: str, points: SpatialData) -> None:
         """Test read/write."""
         tmpdir = Path(tmp_path) / "tmp.zarr"
@@ -319,3 +340,43 @@ def test_io_table(shapes):
         shapes2.table = adata
         assert shapes2.table is not None
         assert shapes2.table.shape == (5, 10)
+
+
+@pytest.mark.parametrize("error", [None, KeyError, MetadataError])
+@pytest.mark.parametrize("empty", [True, False])
+def test_open_zarr_store_remote_fallback(monkeypatch, error, empty):
+    """Test opening a remote store from its consolidated metadata, and the fallbacks used when this is not possible."""
+    opened = zarr.group()
+    if not empty:
+        opened.create_group("images")
+    opened_consolidated = zarr.group()
+    opened_consolidated.create_group("images")
+    opened_zmetadata = zarr.group()
+    calls = []
+
+    def open_consolidated(store, mode="r", metadata_key=".zmetadata", **kwargs):
+        calls.append(("open_consolidated", metadata_key))
+        if metadata_key == ".zmetadata":
+            if error is not None:
+                raise error(metadata_key)
+            return opened_consolidated
+        return opened_zmetadata
+
+    def open_(store, mode="r", **kwargs):
+        calls.append(("open", None))
+        return opened
+
+    monkeypatch.setattr(zarr, "open_consolidated", open_consolidated)
+    monkeypatch.setattr(zarr, "open", open_)
+    f = _open_zarr_store("https://example.com/data.zarr")
+    if error is None:
+        # the consolidated metadata is found, so zarr.open() is never called
+        assert f is opened_consolidated
+        assert calls == [("open_consolidated", ".zmetadata")]
+    elif empty:
+        # a remote store opened with zarr.open() can't be listed, so the zmetadata workaround is used
+        assert f is opened_zmetadata
+        assert calls == [("open_consolidated", ".zmetadata"), ("open", None), ("open_consolidated", "zmetadata")]
+    else:
+        assert f is opened
+        assert calls == [("open_consolidated", ".zmetadata"), ("open", None)]